@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Load-replay simulation of saturation-based autoscaling
+
+Replays a load profile against simulated pods, each with its own AgentMonitor
+whose SaturationTracker runs on a virtual clock, and scales them with the
+HorizontalPodAutoscaler algorithm from k8s/hpa.yaml. The HPA reads
+``bmasterai_saturation`` and ``bmasterai_saturation_queue_depth`` from each
+pod's rendered /metrics text, as prometheus-adapter would, so the whole path
+from ``track_llm_call`` to the scaling decision is exercised.
+
+Each request is one LLM call. A pod runs up to --max-concurrency calls at once
+and queues the rest; new pods take --pod-startup seconds to become ready.
+
+Usage:
+    python benchmarks/autoscaling_simulation.py --profile spike
+    python benchmarks/autoscaling_simulation.py --trace requests.csv   # "second,requests_per_second" rows
+
+Prints one line per minute (load, replicas, saturation, queue, wait p95) and a
+summary of queueing delay and pod-minutes, to compare targets and limits
+before changing the HPA.
+"""
+
+import argparse
+import csv
+import math
+import os
+import random
+import re
+import sys
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bmasterai.monitoring import AgentMonitor
+from bmasterai.prometheus import PrometheusExporter
+from bmasterai.saturation import SaturationTracker
+
+_GAUGE = re.compile(r'^(bmasterai_saturation\w*) (\S+)$', re.MULTILINE)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def load_profile(args):
+    """Requests per second for each second of the run."""
+    if args.trace:
+        with open(args.trace) as f:
+            rows = [(int(float(second)), float(rate)) for second, rate in csv.reader(f) if second.strip()[0].isdigit()]
+        length = max(second for second, _ in rows) + 1
+        rates = [0.0] * length
+        for second, rate in rows:
+            rates[second] = rate
+        return rates
+
+    base, peak, length = args.base_rps, args.peak_rps, args.duration
+    if args.profile == 'ramp':
+        return [base + (peak - base) * min(1.0, t / (length * 0.6)) for t in range(length)]
+    if args.profile == 'spike':
+        return [peak if length * 0.3 <= t < length * 0.5 else base for t in range(length)]
+    # diurnal: one sine period over the run
+    return [base + (peak - base) * (1 - math.cos(2 * math.pi * t / length)) / 2 for t in range(length)]
+
+
+class Pod:
+    def __init__(self, index, args, clock, ready_at):
+        self.name = f'pod-{index}'
+        self.ready_at = ready_at
+        self.monitor = AgentMonitor()
+        self.monitor.saturation = SaturationTracker(args.max_concurrency, args.token_rate_limit or None,
+                                                    args.queue_capacity or None, clock=clock)
+        self.exporter = PrometheusExporter(self.monitor)
+        self.max_concurrency = args.max_concurrency
+        self.running = []  # end times
+        self.queue = deque()  # enqueue times
+
+    def ready(self, now):
+        return now >= self.ready_at
+
+    def load(self):
+        return len(self.running) + len(self.queue)
+
+    def submit(self, now):
+        self.queue.append(now)
+        self.monitor.saturation.enqueue()
+
+    def step(self, now, args, rng, waits):
+        saturation = self.monitor.saturation
+        still_running = []
+        for end in self.running:
+            if end <= now:
+                saturation.call_finished()
+                tokens = max(1, int(rng.gauss(args.tokens_per_call, args.tokens_per_call * 0.3)))
+                self.monitor.track_llm_call('agent', 'model', tokens, 0.0)
+            else:
+                still_running.append(end)
+        self.running = still_running
+        while self.queue and len(self.running) < self.max_concurrency:
+            waits.append(now - self.queue.popleft())
+            saturation.dequeue()
+            saturation.call_started()
+            self.running.append(now + rng.lognormvariate(math.log(args.call_seconds), 0.5))
+
+    def scrape(self):
+        return {name: float(value) for name, value in _GAUGE.findall(self.exporter.render())}
+
+
+class HPA:
+    """The autoscaling/v2 algorithm with the behavior in k8s/hpa.yaml."""
+
+    def __init__(self, args):
+        self.args = args
+        self.recommendations = deque()  # (time, desired) for scale-down stabilization
+        self.scale_ups = deque()  # (time, pods added) for the 2-pods-per-60s policy
+        self.last_scale_down = -math.inf
+
+    def desired(self, now, current, metrics):
+        args = self.args
+        # Each metric proposes ceil(current * average / target); the largest proposal wins
+        proposals = []
+        for name, target in (('bmasterai_saturation', args.target),
+                             ('bmasterai_saturation_queue_depth', args.queue_target)):
+            if not metrics or not target:
+                continue
+            ratio = sum(m.get(name, 0.0) for m in metrics) / len(metrics) / target
+            proposals.append(current if abs(ratio - 1) <= 0.1 else math.ceil(current * ratio))
+        desired = max(proposals, default=current)
+
+        # Scale-down stabilization: the highest recommendation within the window wins
+        self.recommendations.append((now, desired))
+        while self.recommendations[0][0] < now - args.scale_down_window:
+            self.recommendations.popleft()
+        stabilized = max(d for _, d in self.recommendations)
+
+        if stabilized > current:
+            while self.scale_ups and self.scale_ups[0][0] <= now - 60:
+                self.scale_ups.popleft()
+            # selectPolicy Max of: 100% per 15s, 2 pods per 60s
+            limit = max(current * 2, current + 2 - sum(n for _, n in self.scale_ups))
+            target = min(stabilized, limit, args.max_replicas)
+            self.scale_ups.append((now, target - current))
+            return target
+        if stabilized < current and now - self.last_scale_down >= 60:
+            # 10% per 60s, at least one pod
+            self.last_scale_down = now
+            return max(stabilized, current - max(1, int(current * 0.1)), args.min_replicas)
+        return current
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profile', choices=('spike', 'ramp', 'diurnal'), default='spike')
+    parser.add_argument('--trace', help='CSV of "second,requests_per_second" to replay instead of a profile')
+    parser.add_argument('--duration', type=int, default=3600, help='seconds (profiles only)')
+    parser.add_argument('--base-rps', type=float, default=2.0)
+    parser.add_argument('--peak-rps', type=float, default=12.0)
+    parser.add_argument('--call-seconds', type=float, default=3.0, help='median LLM call duration')
+    parser.add_argument('--tokens-per-call', type=float, default=1500)
+    parser.add_argument('--max-concurrency', type=int, default=8)
+    parser.add_argument('--token-rate-limit', type=float, default=0, help='tokens per minute per pod; 0 = none')
+    parser.add_argument('--queue-capacity', type=int, default=0)
+    parser.add_argument('--target', type=float, default=0.7, help='average bmasterai_saturation per pod')
+    parser.add_argument('--queue-target', type=float, default=5, help='average queue depth per pod; 0 = off')
+    parser.add_argument('--min-replicas', type=int, default=2)
+    parser.add_argument('--max-replicas', type=int, default=10)
+    parser.add_argument('--pod-startup', type=float, default=30)
+    parser.add_argument('--sync-period', type=float, default=15, help='HPA sync and scrape interval')
+    parser.add_argument('--scale-down-window', type=float, default=300)
+    parser.add_argument('--tick', type=float, default=0.25)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    clock = Clock()
+    rates = load_profile(args)
+    pods = [Pod(i, args, clock, ready_at=0.0) for i in range(args.min_replicas)]
+    next_index = len(pods)
+    hpa = HPA(args)
+    waits, minute_waits = [], []
+    pod_seconds = saturated_seconds = 0.0
+    next_arrival = rng.expovariate(rates[0]) if rates[0] else args.tick
+    next_sync = args.sync_period
+    last = {}
+
+    print(f"{'min':>4} {'rps':>6} {'pods':>5} {'ready':>5} {'saturation':>10} {'queued':>6} {'wait_p95_s':>10}")
+    steps = int(len(rates) / args.tick)
+    for step in range(1, steps + 1):
+        now = clock.now = step * args.tick
+        rate = rates[min(int(now), len(rates) - 1)]
+        ready = [p for p in pods if p.ready(now)]
+        while next_arrival <= now:
+            min(ready, key=Pod.load).submit(next_arrival)
+            next_arrival += rng.expovariate(rate) if rate else args.tick
+        for pod in pods:
+            pod.step(now, args, rng, minute_waits)
+        pod_seconds += len(pods) * args.tick
+
+        if now >= next_sync:
+            next_sync += args.sync_period
+            metrics = [p.scrape() for p in ready]
+            last = {'saturation': sum(m.get('bmasterai_saturation', 0) for m in metrics) / len(metrics),
+                    'queued': sum(m.get('bmasterai_saturation_queue_depth', 0) for m in metrics)}
+            if last['saturation'] >= 1.0:
+                saturated_seconds += args.sync_period
+            desired = hpa.desired(now, len(pods), metrics)
+            while len(pods) < desired:
+                pods.append(Pod(next_index, args, clock, ready_at=now + args.pod_startup))
+                next_index += 1
+            while len(pods) > desired:
+                # Drain the least loaded pod: requeue its waiting work elsewhere
+                victim = min(pods, key=Pod.load)
+                pods.remove(victim)
+                survivors = [p for p in pods if p.ready(now)] or pods
+                for enqueued in victim.queue:
+                    min(survivors, key=Pod.load).submit(enqueued)
+
+        if step % int(60 / args.tick) == 0:
+            waits.extend(minute_waits)
+            print(f"{int(now // 60):>4} {rate:>6.1f} {len(pods):>5} {len([p for p in pods if p.ready(now)]):>5} "
+                  f"{last.get('saturation', 0):>10.2f} {last.get('queued', 0):>6.0f} "
+                  f"{percentile(minute_waits, 95):>10.1f}")
+            minute_waits = []
+
+    waits.extend(minute_waits)
+    print()
+    print(f"requests served      {len(waits)}")
+    print(f"queue wait p50/p95/p99  {percentile(waits, 50):.2f}s / {percentile(waits, 95):.2f}s / "
+          f"{percentile(waits, 99):.2f}s")
+    print(f"pod-minutes          {pod_seconds / 60:.0f}")
+    print(f"time at saturation   {saturated_seconds / 60:.1f} min")
+
+
+if __name__ == '__main__':
+    main()
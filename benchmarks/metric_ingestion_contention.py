@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark for MetricsCollector.record_custom_metric
+
+Runs N writer threads recording into the same series while a reader thread
+polls get_metric_stats/export_metrics, and reports write throughput and the
+number of reader errors (e.g. "deque mutated during iteration").
+
+Usage:
+    python benchmarks/metric_ingestion_contention.py
+    python benchmarks/metric_ingestion_contention.py --threads 1 8 64 --points 20000
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bmasterai.monitoring import MetricsCollector
+
+
+def run(threads: int, points_per_thread: int) -> dict:
+    collector = MetricsCollector()
+    stop = threading.Event()
+    reader_errors = []
+    reads = 0
+
+    def writer(worker_id: int):
+        labels = {'agent_id': f'agent-{worker_id % 4}'}
+        for i in range(points_per_thread):
+            collector.record_custom_metric('llm_tokens_used', float(i), labels)
+
+    def reader():
+        nonlocal reads
+        while not stop.is_set():
+            try:
+                collector.get_metric_stats('llm_tokens_used')
+                collector.export_metrics()
+                reads += 1
+            except RuntimeError as e:
+                reader_errors.append(e)
+
+    reader_thread = threading.Thread(target=reader)
+    writers = [threading.Thread(target=writer, args=(i,)) for i in range(threads)]
+
+    reader_thread.start()
+    start = time.perf_counter()
+    for t in writers:
+        t.start()
+    for t in writers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    reader_thread.join()
+
+    total = threads * points_per_thread
+    return {
+        'threads': threads,
+        'points': total,
+        'seconds': elapsed,
+        'points_per_sec': total / elapsed,
+        'ns_per_point': elapsed / total * 1e9,
+        'reads': reads,
+        'reader_errors': len(reader_errors),
+        'recorded': collector.custom_metrics.version('llm_tokens_used'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8, 64])
+    parser.add_argument('--points', type=int, default=20000, help='points per writer thread')
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'points':>10} {'pts/sec':>12} {'ns/pt':>8} {'reads':>7} {'errors':>7} {'lost':>6}")
+    for threads in args.threads:
+        r = run(threads, args.points)
+        print(f"{r['threads']:>8} {r['points']:>10} {r['points_per_sec']:>12,.0f} "
+              f"{r['ns_per_point']:>8.0f} {r['reads']:>7} {r['reader_errors']:>7} "
+              f"{r['points'] - r['recorded']:>6}")
+
+
+if __name__ == '__main__':
+    main()
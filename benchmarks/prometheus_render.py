@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Scrape-cost benchmark for the Prometheus exporter
+
+Builds up N label sets across a counter, a gauge and a histogram metric, then
+times scrapes with no new data and with a small number of new points, which is
+what a 10s scrape interval sees in steady state.
+
+Usage:
+    python benchmarks/prometheus_render.py --series 50000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bmasterai.monitoring import AgentMonitor
+from bmasterai.prometheus import PrometheusExporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--series', type=int, default=50000)
+    parser.add_argument('--new-points', type=int, default=200, help='points added between steady-state scrapes')
+    parser.add_argument('--scrapes', type=int, default=20)
+    args = parser.parse_args()
+
+    monitor = AgentMonitor()
+    exporter = PrometheusExporter(monitor)
+    metrics = [('llm_tokens_used', 120), ('queue_depth', 4), ('llm_call_duration_ms', 850.0)]
+    per_metric = args.series // len(metrics)
+
+    # Feed in chunks smaller than the series window so nothing is evicted unseen
+    start = time.perf_counter()
+    for offset in range(0, per_metric, 500):
+        for name, value in metrics:
+            monitor.metrics_collector.record_metrics(
+                [(name, value, {'agent_id': f'agent-{i}'}) for i in range(offset, min(offset + 500, per_metric))]
+            )
+        exporter.render()
+    print(f"warm-up: {args.series} series in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    text = exporter.render()
+    print(f"first full scrape: {(time.perf_counter() - start) * 1000:.1f} ms, {len(text) / 1e6:.1f} MB")
+
+    idle = []
+    for _ in range(args.scrapes):
+        start = time.perf_counter()
+        exporter.render()
+        idle.append(time.perf_counter() - start)
+
+    busy = []
+    for n in range(args.scrapes):
+        for i in range(args.new_points):
+            name, value = metrics[i % len(metrics)]
+            monitor.record_custom_metric(name, value, {'agent_id': f'agent-{(n * args.new_points + i) % per_metric}'})
+        start = time.perf_counter()
+        exporter.render()
+        busy.append(time.perf_counter() - start)
+
+    print(f"scrape, no new data:         median {sorted(idle)[len(idle) // 2] * 1000:.2f} ms")
+    print(f"scrape, {args.new_points} new points:      median {sorted(busy)[len(busy) // 2] * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()